@@ -0,0 +1,68 @@
+"""Persistent on-disk translation cache backed by SQLite."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Stay well below SQLite's default limit on bound parameters per statement.
+_MAX_QUERY_PARAMS = 500
+
+
+def cache_key(provider: str, model: str, source_lang: str, target_lang: str, text: str) -> str:
+    """Return the stable digest identifying one translation of ``text``."""
+    payload = f"{provider}|{model}|{source_lang}|{target_lang}|{text}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class PersistentCache:
+    """Store translations across runs so re-translating a deck costs no API calls.
+
+    Entries live in a single ``translations(key, value)`` table in WAL mode;
+    one connection is shared between threads and serialised by a lock.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Return the cached values for whichever of ``keys`` are stored."""
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_PARAMS):
+                chunk = keys[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM translations WHERE key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        return found
+
+    def get(self, key: str) -> str | None:
+        return self.get_many([key]).get(key)
+
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Insert or replace ``(key, value)`` pairs in one transaction."""
+        rows: List[Tuple[str, str]] = list(items)
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
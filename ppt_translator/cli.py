@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Sequence
 
@@ -33,8 +34,30 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--max-workers",
         type=int,
+        default=20,
+        help="Maximum number of concurrent translation requests.",
+    )
+    parser.add_argument(
+        "--batch-mode",
+        choices=("sync", "async"),
+        default="sync",
+        help="Use 'async' to submit translations as a discounted offline batch job where supported.",
+    )
+    parser.add_argument(
+        "--batch-min-texts",
+        type=int,
+        default=100,
+        help="Only use a batch job for decks with at least this many strings to translate (default: 100).",
+    )
+    parser.add_argument(
+        "--max-decks",
+        type=int,
         default=4,
-        help="Number of worker threads used while reading slides.",
+        help="Maximum number of presentations processed concurrently.",
+    )
+    parser.add_argument(
+        "--cache-file",
+        help="SQLite file used to persist translations between runs (disabled by default).",
     )
     parser.add_argument(
         "--keep-intermediate",
@@ -57,28 +80,39 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
     except ValueError as exc:
         parser.error(str(exc))
 
-    translator = TranslationService(provider, max_chunk_size=args.max_chunk_size)
+    translator = TranslationService(
+        provider,
+        max_chunk_size=args.max_chunk_size,
+        max_concurrency=max(1, args.max_workers),
+        batch_mode=args.batch_mode,
+        batch_job_min_texts=args.batch_min_texts,
+        cache_path=Path(clean_path(args.cache_file)).expanduser() if args.cache_file else None,
+    )
 
     files = list(iter_presentation_files(target_path))
     if not files:
         print("No PowerPoint files were found at the provided location.")
         return 1
 
-    exit_code = 0
-    for ppt_file in files:
+    def process(ppt_file: Path) -> bool:
         try:
             process_ppt_file(
                 ppt_file,
                 translator=translator,
                 source_lang=args.source_lang,
                 target_lang=args.target_lang,
-                max_workers=args.max_workers,
                 cleanup=not args.keep_intermediate,
             )
         except Exception as exc:  # pragma: no cover - CLI logging
             print(f"Error processing {ppt_file}: {exc}")
-            exit_code = 1
-    return exit_code
+            return False
+        return True
+
+    # Decks are independent and API-bound; the shared translator keeps one
+    # cache and one request concurrency limit across all of them.
+    with ThreadPoolExecutor(max_workers=max(1, min(args.max_decks, len(files)))) as executor:
+        results = list(executor.map(process, files))
+    return 0 if all(results) else 1
 
 
 def main() -> None:
@@ -1,32 +1,108 @@
 """PowerPoint translation pipeline utilities."""
 from __future__ import annotations
 
+import glob
 import json
-import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from xml.dom import minidom
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from lxml import etree as ET
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.enum.text import PP_ALIGN
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
 from pptx.util import Pt
 
 from .translation import TranslationService
 
+try:  # optional C-accelerated JSON for the per-shape property payloads
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_DRAWINGML_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+_LANGUAGE_ATTRIBUTES = ("lang", "altLang")
+_LINE_BREAK_TAG = f"{{{_DRAWINGML_NS['a']}}}br"
+_PARAGRAPHS_XPATH = ET.XPath("a:p", namespaces=_DRAWINGML_NS)
+_PARAGRAPH_TEXT_XPATH = ET.XPath("a:r/a:t | a:br | a:fld/a:t", namespaces=_DRAWINGML_NS)
+
+_ALIGNMENT_MAP = {
+    key: member
+    for member in PP_ALIGN
+    for key in (str(member), member.name, f"PP_ALIGN.{member.name}", f"PP_ALIGN.{member}")
+}
+
+_VERTICAL_ANCHOR_MAP = {
+    key: member
+    for member in MSO_ANCHOR
+    for key in (str(member), member.name, f"MSO_ANCHOR.{member.name}")
+}
+
+
+def _dump_properties(data: dict) -> str:
+    """Serialise shape properties as compact, non-ASCII-preserving JSON."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+_load_properties = orjson.loads if orjson is not None else json.loads
+
 
 def get_alignment_value(alignment_str: str | None):
     """Convert alignment string to PP_ALIGN enum value."""
-    alignment_map = {
-        "PP_ALIGN.CENTER": PP_ALIGN.CENTER,
-        "PP_ALIGN.LEFT": PP_ALIGN.LEFT,
-        "PP_ALIGN.RIGHT": PP_ALIGN.RIGHT,
-        "PP_ALIGN.JUSTIFY": PP_ALIGN.JUSTIFY,
-        "None": None,
-        None: None,
-    }
-    return alignment_map.get(alignment_str)
+    return _ALIGNMENT_MAP.get(alignment_str)
+
+
+def get_vertical_anchor_value(anchor_str: str | None):
+    """Convert a stored vertical anchor string to its MSO_ANCHOR value."""
+    return _VERTICAL_ANCHOR_MAP.get(anchor_str)
+
+
+def _xsd_bool(value: str | None):
+    if value is None:
+        return None
+    return value in ("1", "true")
+
+
+def get_text_body_text(txBody) -> str:
+    """Return the text of a ``<a:txBody>`` the way python-pptx's ``TextFrame.text`` does.
+
+    Paragraphs are joined by newlines and line breaks become vertical tabs,
+    but the XML is read in two compiled XPath queries instead of through the
+    paragraph and run wrapper objects.
+    """
+    return "\n".join(
+        "".join("\v" if node.tag == _LINE_BREAK_TAG else (node.text or "") for node in _PARAGRAPH_TEXT_XPATH(p))
+        for p in _PARAGRAPHS_XPATH(txBody)
+    )
+
+
+def get_run_font_properties(txBody) -> dict:
+    """Read the first run's font properties directly from a ``<a:txBody>`` element.
+
+    Querying the ``<a:rPr>`` XML avoids building python-pptx wrapper objects
+    for every run and, unlike ``Font.color``, never inserts a ``<a:solidFill>``
+    into the source run as a side effect of reading it.
+    """
+    properties = {"font_size": None, "font_name": None, "bold": None, "italic": None, "font_color": None}
+    paragraph = txBody.find("a:p", _DRAWINGML_NS)
+    run = paragraph.find("a:r", _DRAWINGML_NS) if paragraph is not None else None
+    rPr = run.find("a:rPr", _DRAWINGML_NS) if run is not None else None
+    if rPr is None:
+        return properties
+    size = rPr.get("sz")
+    if size is not None:
+        properties["font_size"] = int(size) / 100
+    latin = rPr.find("a:latin", _DRAWINGML_NS)
+    properties["font_name"] = (latin.get("typeface") if latin is not None else None) or None
+    properties["bold"] = _xsd_bool(rPr.get("b"))
+    properties["italic"] = _xsd_bool(rPr.get("i"))
+    rgb = rPr.find("a:solidFill/a:srgbClr", _DRAWINGML_NS)
+    if rgb is not None and rgb.get("val"):
+        properties["font_color"] = rgb.get("val").upper()
+    return properties
 
 
 def get_shape_properties(shape):
@@ -47,36 +123,51 @@ def get_shape_properties(shape):
         "space_after": None,
         "font_color": None,
     }
-    if hasattr(shape, "text"):
-        shape_data["text"] = shape.text.strip()
-        if hasattr(shape, "text_frame"):
-            for paragraph in shape.text_frame.paragraphs:
-                if paragraph.runs:
-                    run = paragraph.runs[0]
-                    if getattr(run.font, "size", None) is not None:
-                        shape_data["font_size"] = run.font.size.pt
-                    if getattr(run.font, "name", None):
-                        shape_data["font_name"] = run.font.name
-                    if hasattr(run.font, "bold"):
-                        shape_data["bold"] = run.font.bold
-                    if hasattr(run.font, "italic"):
-                        shape_data["italic"] = run.font.italic
-                    if (
-                        getattr(run.font, "color", None) is not None
-                        and getattr(run.font.color, "rgb", None) is not None
-                    ):
-                        shape_data["font_color"] = str(run.font.color.rgb)
-                if getattr(paragraph, "line_spacing", None) is not None:
-                    shape_data["line_spacing"] = paragraph.line_spacing
-                if getattr(paragraph, "space_before", None) is not None:
-                    shape_data["space_before"] = paragraph.space_before
-                if getattr(paragraph, "space_after", None) is not None:
-                    shape_data["space_after"] = paragraph.space_after
-                if getattr(paragraph, "alignment", None) is not None:
-                    shape_data["alignment"] = f"PP_ALIGN.{paragraph.alignment}" if paragraph.alignment else None
+    if not shape.has_text_frame:
+        return shape_data
+    text_frame = shape.text_frame
+    shape_data["text"] = get_text_body_text(text_frame._txBody).strip()
+
+    # Only the first paragraph's formatting is re-applied on rebuild, so only
+    # that paragraph (and its first run) is inspected.
+    paragraph = text_frame.paragraphs[0]
+    shape_data.update(get_run_font_properties(text_frame._txBody))
+    shape_data["line_spacing"] = paragraph.line_spacing
+    shape_data["space_before"] = paragraph.space_before
+    shape_data["space_after"] = paragraph.space_after
+    alignment = paragraph.alignment
+    shape_data["alignment"] = f"PP_ALIGN.{alignment.name}" if alignment is not None else None
     return shape_data
 
 
+def _replace_text_in_place(text_frame, text: str):
+    """Put ``text`` into the first run of ``text_frame`` and drop the other content.
+
+    The first run and paragraph XML are reused rather than recreated, so any
+    run or paragraph formatting that is not captured on extraction (hyperlinks,
+    effects) survives the rebuild. Language tags describe the source text, so
+    they are dropped and PowerPoint detects the language of ``text`` for
+    proofing instead.
+    """
+    txBody = text_frame._txBody
+    paragraphs = text_frame.paragraphs
+    for extra in paragraphs[1:]:
+        txBody.remove(extra._p)
+    paragraph = paragraphs[0]
+    p = paragraph._p
+    runs = paragraph.runs
+    run = runs[0] if runs else paragraph.add_run()
+    for child in p.findall("a:br", _DRAWINGML_NS) + p.findall("a:fld", _DRAWINGML_NS):
+        p.remove(child)
+    for extra in runs[1:]:
+        p.remove(extra._r)
+    run.text = text
+    for properties in p.findall("a:r/a:rPr", _DRAWINGML_NS) + p.findall("a:endParaRPr", _DRAWINGML_NS):
+        for attribute in _LANGUAGE_ATTRIBUTES:
+            properties.attrib.pop(attribute, None)
+    return paragraph, run
+
+
 def apply_shape_properties(shape, shape_data):
     """Apply saved properties to a shape."""
     try:
@@ -84,10 +175,7 @@ def apply_shape_properties(shape, shape_data):
         shape.height = shape_data["height"]
         shape.left = shape_data["left"]
         shape.top = shape_data["top"]
-        shape.text = ""
-        paragraph = shape.text_frame.paragraphs[0]
-        run = paragraph.add_run()
-        run.text = shape_data["text"]
+        paragraph, run = _replace_text_in_place(shape.text_frame, shape_data["text"])
         if shape_data.get("font_size"):
             adjusted_size = shape_data["font_size"] * 0.7
             run.font.size = Pt(adjusted_size)
@@ -120,8 +208,10 @@ def get_table_properties(table):
     for row in table.rows:
         row_data = []
         for cell in row.cells:
+            text_frame = cell.text_frame
+            anchor = cell.vertical_anchor
             cell_data = {
-                "text": cell.text.strip(),
+                "text": get_text_body_text(text_frame._txBody).strip(),
                 "font_size": None,
                 "font_name": None,
                 "alignment": None,
@@ -129,28 +219,13 @@ def get_table_properties(table):
                 "margin_right": cell.margin_right,
                 "margin_top": cell.margin_top,
                 "margin_bottom": cell.margin_bottom,
-                "vertical_anchor": str(cell.vertical_anchor) if cell.vertical_anchor else None,
+                "vertical_anchor": anchor.name if anchor is not None else None,
                 "font_color": None,
             }
-            if cell.text_frame.paragraphs:
-                paragraph = cell.text_frame.paragraphs[0]
-                if paragraph.runs:
-                    run = paragraph.runs[0]
-                    if getattr(run.font, "size", None) is not None:
-                        cell_data["font_size"] = run.font.size.pt
-                    if getattr(run.font, "name", None):
-                        cell_data["font_name"] = run.font.name
-                    if hasattr(run.font, "bold"):
-                        cell_data["bold"] = run.font.bold
-                    if hasattr(run.font, "italic"):
-                        cell_data["italic"] = run.font.italic
-                    if (
-                        getattr(run.font, "color", None) is not None
-                        and getattr(run.font.color, "rgb", None) is not None
-                    ):
-                        cell_data["font_color"] = str(run.font.color.rgb)
-                if getattr(paragraph, "alignment", None) is not None:
-                    cell_data["alignment"] = f"PP_ALIGN.{paragraph.alignment}" if paragraph.alignment else None
+            cell_data.update(get_run_font_properties(text_frame._txBody))
+            alignment = text_frame.paragraphs[0].alignment
+            if alignment is not None:
+                cell_data["alignment"] = f"PP_ALIGN.{alignment.name}"
             row_data.append(cell_data)
         table_data["cells"].append(row_data)
     return table_data
@@ -167,11 +242,8 @@ def apply_table_properties(table, table_data):
                 cell.margin_top = cell_data["margin_top"]
                 cell.margin_bottom = cell_data["margin_bottom"]
                 if cell_data.get("vertical_anchor"):
-                    cell.vertical_anchor = eval(cell_data["vertical_anchor"])
-                cell.text = ""
-                paragraph = cell.text_frame.paragraphs[0]
-                run = paragraph.add_run()
-                run.text = cell_data["text"]
+                    cell.vertical_anchor = get_vertical_anchor_value(cell_data["vertical_anchor"])
+                paragraph, run = _replace_text_in_place(cell.text_frame, cell_data["text"])
                 if cell_data.get("font_size"):
                     adjusted_size = cell_data["font_size"] * 0.8
                     run.font.size = Pt(adjusted_size)
@@ -188,6 +260,161 @@ def apply_table_properties(table, table_data):
                 print(f"Error setting cell properties: {exc}")
 
 
+@dataclass
+class SlideData:
+    """Shape and table properties extracted from one slide, before translation.
+
+    ``entries`` holds ``(tag, shape_index, properties)`` tuples in shape order,
+    where ``tag`` is ``"text_element"`` or ``"table_element"`` and
+    ``shape_index`` is a locator from :func:`iter_slide_shapes`.
+    """
+
+    number: int
+    entries: List[Tuple[str, str, dict]] = field(default_factory=list)
+
+    def iter_texts(self) -> Iterator[str]:
+        """Yield every shape and table cell text of the slide."""
+        for tag, _, data in self.entries:
+            if tag == "table_element":
+                for row in data["cells"]:
+                    for cell in row:
+                        yield cell["text"]
+            else:
+                yield data["text"]
+
+
+def iter_slide_shapes(shapes, prefix: str = "") -> Iterator[Tuple[str, object]]:
+    """Yield ``(locator, shape)`` for ``shapes``, descending into group shapes.
+
+    Top-level shapes are located by their index (``"3"``); shapes inside a
+    group append their index within the group (``"3.0"``, ``"3.1"``).
+    """
+    for index, shape in enumerate(shapes):
+        locator = f"{prefix}{index}"
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from iter_slide_shapes(shape.shapes, f"{locator}.")
+        else:
+            yield locator, shape
+
+
+def extract_slide(slide, slide_number: int) -> SlideData:
+    """Collect shape and table properties of a slide without translating."""
+    slide_data = SlideData(slide_number)
+    for locator, shape in iter_slide_shapes(slide.shapes):
+        if shape.has_table:
+            slide_data.entries.append(("table_element", locator, get_table_properties(shape.table)))
+        elif shape.has_text_frame:
+            shape_data = get_shape_properties(shape)
+            if shape_data["text"]:
+                slide_data.entries.append(("text_element", locator, shape_data))
+    return slide_data
+
+
+def extract_deck(prs) -> List[SlideData]:
+    """Extract every slide of ``prs`` once; the result renders both XML variants."""
+    return [extract_slide(slide, slide_number) for slide_number, slide in enumerate(prs.slides, start=1)]
+
+
+def translate_deck(
+    slides: List[SlideData],
+    *,
+    translator: TranslationService,
+    source_lang: str,
+    target_lang: str,
+) -> Dict[str, str]:
+    """Translate each unique string of the deck once and return a source -> translation map."""
+    unique_texts = list(dict.fromkeys(text for slide in slides for text in slide.iter_texts() if text))
+    if not unique_texts:
+        return {}
+    return dict(zip(unique_texts, translator.translate_batch(unique_texts, source_lang, target_lang)))
+
+
+def _with_translations(tag: str, data: dict, translations: Dict[str, str]) -> dict:
+    """Return a copy of ``data`` whose texts are replaced through ``translations``."""
+    if tag == "table_element":
+        cells = [
+            [{**cell, "text": translations.get(cell["text"], cell["text"])} for cell in row] for row in data["cells"]
+        ]
+        return {**data, "cells": cells}
+    return {**data, "text": translations.get(data["text"], data["text"])}
+
+
+def build_slide_element(slide_data: SlideData, translations: Optional[Dict[str, str]] = None) -> ET.Element:
+    """Serialise a slide into a ``<slide>`` element, optionally translating its texts."""
+    slide_element = ET.Element("slide")
+    slide_element.set("number", str(slide_data.number))
+    for tag, shape_index, data in slide_data.entries:
+        if translations is not None:
+            data = _with_translations(tag, data, translations)
+        element = ET.SubElement(slide_element, tag)
+        element.set("shape_index", shape_index)
+        props_element = ET.SubElement(element, "properties")
+        props_element.text = _dump_properties(data)
+    return slide_element
+
+
+def _iter_slide_elements(
+    slides: List[SlideData],
+    file_name: str,
+    translations: Optional[Dict[str, str]],
+    intermediate_dir: Optional[Path],
+) -> Iterator[ET.Element]:
+    """Yield each slide's element, first writing it to ``intermediate_dir`` if given.
+
+    Intermediate files are prefixed with the deck's stem so decks sharing a
+    directory never write to the same file.
+    """
+    variant = "original" if translations is None else "translated"
+    stem = Path(file_name).stem
+    for slide_data in slides:
+        slide_element = build_slide_element(slide_data, translations)
+        if intermediate_dir is not None:
+            intermediate_path = intermediate_dir / f"{stem}_slide_{slide_data.number}_{variant}.xml"
+            ET.ElementTree(slide_element).write(intermediate_path, encoding="utf-8", xml_declaration=True)
+        yield slide_element
+
+
+def render_xml(
+    slides: List[SlideData],
+    *,
+    file_name: str,
+    translations: Optional[Dict[str, str]] = None,
+    intermediate_dir: Optional[Path] = None,
+) -> ET.Element:
+    """Build the indented ``<presentation>`` tree for the original or translated deck.
+
+    When ``intermediate_dir`` is given, each slide is also written to its own
+    ``{stem}_slide_N_{original,translated}.xml`` file there.
+    """
+    root = ET.Element("presentation")
+    root.set("file_path", file_name)
+    root.extend(_iter_slide_elements(slides, file_name, translations, intermediate_dir))
+    ET.indent(root, space="  ")
+    return root
+
+
+def write_xml(
+    slides: List[SlideData],
+    output_path: Path,
+    *,
+    file_name: str,
+    translations: Optional[Dict[str, str]] = None,
+    intermediate_dir: Optional[Path] = None,
+) -> None:
+    """Stream the same document :func:`render_xml` builds straight to ``output_path``.
+
+    Slides are serialised one at a time with ``lxml.etree.xmlfile`` so peak
+    memory stays at a single slide's subtree instead of the whole deck.
+    """
+    with ET.xmlfile(str(output_path), encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("presentation", file_path=file_name):
+            for slide_element in _iter_slide_elements(slides, file_name, translations, intermediate_dir):
+                ET.indent(slide_element, space="  ", level=1)
+                xf.write("\n  ", slide_element)
+            xf.write("\n")
+
+
 def extract_text_from_slide(
     slide,
     slide_number: int,
@@ -197,28 +424,13 @@ def extract_text_from_slide(
     target_lang: str,
 ):
     """Extract text from a slide and optionally translate it."""
-    slide_element = ET.Element("slide")
-    slide_element.set("number", str(slide_number))
-    for shape_index, shape in enumerate(slide.shapes):
-        if shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-            table_element = ET.SubElement(slide_element, "table_element")
-            table_element.set("shape_index", str(shape_index))
-            table_data = get_table_properties(shape.table)
-            if translator:
-                for row in table_data["cells"]:
-                    for cell in row:
-                        cell["text"] = translator.translate(cell["text"], source_lang, target_lang)
-            props_element = ET.SubElement(table_element, "properties")
-            props_element.text = json.dumps(table_data, indent=2)
-        elif hasattr(shape, "text"):
-            text_element = ET.SubElement(slide_element, "text_element")
-            text_element.set("shape_index", str(shape_index))
-            shape_data = get_shape_properties(shape)
-            if translator:
-                shape_data["text"] = translator.translate(shape_data["text"], source_lang, target_lang)
-            props_element = ET.SubElement(text_element, "properties")
-            props_element.text = json.dumps(shape_data, indent=2)
-    return slide_element
+    slide_data = extract_slide(slide, slide_number)
+    translations = None
+    if translator:
+        translations = translate_deck(
+            [slide_data], translator=translator, source_lang=source_lang, target_lang=target_lang
+        )
+    return build_slide_element(slide_data, translations)
 
 
 def ppt_to_xml(
@@ -227,78 +439,146 @@ def ppt_to_xml(
     translator: TranslationService | None,
     source_lang: str,
     target_lang: str,
-    max_workers: int = 4,
-) -> Optional[str]:
-    """Convert a PowerPoint presentation to XML."""
-    root = ET.Element("presentation")
-    base_dir = Path(ppt_path).parent
+    presentation=None,
+    write_intermediate: bool = True,
+) -> Optional[ET.Element]:
+    """Convert a PowerPoint presentation to an indented ``<presentation>`` tree.
+
+    All slides are collected first so repeated strings across the deck (titles,
+    footers, legends) are translated exactly once before the XML is built.
+    Pass an already loaded ``presentation`` to avoid re-reading ``ppt_path``.
+    Per-slide ``{stem}_slide_N_*.xml`` files are skipped when ``write_intermediate``
+    is false.
+    """
     try:
-        prs = Presentation(ppt_path)
-        root.set("file_path", Path(ppt_path).name)
-        workers = max(1, max_workers)
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_slide = {
-                executor.submit(
-                    extract_text_from_slide,
-                    slide,
-                    slide_number,
-                    translator=translator,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                ): slide_number
-                for slide_number, slide in enumerate(prs.slides, start=1)
-            }
-            for future, slide_number in future_to_slide.items():
-                slide_element = future.result()
-                root.append(slide_element)
-                intermediate_path = base_dir / f"slide_{slide_number}_{'translated' if translator else 'original'}.xml"
-                xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-                with open(intermediate_path, "w", encoding="utf-8") as handle:
-                    handle.write(xml_str)
-        return minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
+        prs = presentation if presentation is not None else Presentation(ppt_path)
+        slides = extract_deck(prs)
+        translations = None
+        if translator:
+            translations = translate_deck(
+                slides, translator=translator, source_lang=source_lang, target_lang=target_lang
+            )
+        return render_xml(
+            slides,
+            file_name=Path(ppt_path).name,
+            translations=translations,
+            intermediate_dir=Path(ppt_path).parent if write_intermediate else None,
+        )
     except Exception as exc:  # pragma: no cover - best effort logging
         print(f"Error processing presentation: {exc}")
         return None
 
 
-def create_translated_ppt(original_ppt_path: str, translated_xml_path: str, output_ppt_path: str) -> None:
-    """Create a new PowerPoint presentation using translated content."""
+def apply_slide_element(slide, xml_slide) -> None:
+    """Apply the properties stored in ``xml_slide`` to the shapes of ``slide``.
+
+    Part of the XML rebuild API behind :func:`create_translated_ppt`;
+    :func:`process_ppt_file` applies translations with :func:`apply_slide_data`.
+    """
+    elements_by_key = {(element.tag, element.get("shape_index")): element for element in xml_slide}
+    if not elements_by_key:
+        return
+    for locator, shape in iter_slide_shapes(slide.shapes):
+        if shape.has_table:
+            element = elements_by_key.get(("table_element", locator))
+        elif shape.has_text_frame:
+            element = elements_by_key.get(("text_element", locator))
+        else:
+            continue
+        props_element = element.find("properties") if element is not None else None
+        if props_element is None or not props_element.text:
+            continue
+        if shape.has_table:
+            try:
+                apply_table_properties(shape.table, _load_properties(props_element.text))
+            except Exception as exc:  # pragma: no cover
+                print(f"Error applying table properties: {exc}")
+        else:
+            try:
+                apply_shape_properties(shape, _load_properties(props_element.text))
+            except Exception as exc:  # pragma: no cover
+                print(f"Error applying shape properties: {exc}")
+
+
+def create_translated_ppt(
+    original_ppt_path: str,
+    translated_xml_path: str,
+    output_ppt_path: str,
+    *,
+    presentation=None,
+) -> None:
+    """Create a new PowerPoint presentation using translated content.
+
+    This is the legacy XML rebuild API, kept for callers that edit the
+    translated XML by hand; the pipeline itself uses :func:`write_translated_ppt`.
+
+    The translated XML is streamed with ``iterparse`` so each ``<slide>`` is
+    applied and released as soon as it has been read. An already loaded
+    ``presentation`` of the original deck is modified in place instead of
+    re-reading ``original_ppt_path``.
+    """
     try:
-        prs = Presentation(original_ppt_path)
-        tree = ET.parse(translated_xml_path)
-        root = tree.getroot()
-        for slide_number, slide in enumerate(prs.slides, start=1):
-            xml_slide = root.find(f".//slide[@number='{slide_number}']")
-            if xml_slide is None:
+        prs = presentation if presentation is not None else Presentation(original_ppt_path)
+        slides = list(prs.slides)
+        for _, element in ET.iterparse(translated_xml_path, events=("end",)):
+            if element.tag != "slide":
                 continue
-            for shape_index, shape in enumerate(slide.shapes):
-                if shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-                    table_element = xml_slide.find(f".//table_element[@shape_index='{shape_index}']")
-                    if table_element is not None:
-                        props_element = table_element.find("properties")
-                        if props_element is not None and props_element.text:
-                            try:
-                                table_data = json.loads(props_element.text)
-                                apply_table_properties(shape.table, table_data)
-                            except Exception as exc:  # pragma: no cover
-                                print(f"Error applying table properties: {exc}")
-                elif hasattr(shape, "text"):
-                    text_element = xml_slide.find(f".//text_element[@shape_index='{shape_index}']")
-                    if text_element is not None:
-                        props_element = text_element.find("properties")
-                        if props_element is not None and props_element.text:
-                            try:
-                                shape_data = json.loads(props_element.text)
-                                apply_shape_properties(shape, shape_data)
-                            except Exception as exc:  # pragma: no cover
-                                print(f"Error applying shape properties: {exc}")
+            slide_number = int(element.get("number", "0"))
+            if 1 <= slide_number <= len(slides):
+                apply_slide_element(slides[slide_number - 1], element)
+            element.clear()
         prs.save(output_ppt_path)
         print(f"Translated PowerPoint saved to: {output_ppt_path}")
     except Exception as exc:  # pragma: no cover - logging only
         print(f"Error creating translated PowerPoint: {exc}")
 
 
-def cleanup_intermediate_files(base_dir: Path, pattern: str = "slide_*.xml") -> None:
+def apply_slide_data(slide, slide_data: SlideData, translations: Optional[Dict[str, str]] = None) -> None:
+    """Apply extracted (and optionally translated) properties to ``slide`` directly.
+
+    Only the shapes recorded in ``slide_data`` are modified, and slides
+    without any are not walked at all.
+    """
+    if not slide_data.entries:
+        return
+    shapes = dict(iter_slide_shapes(slide.shapes))
+    for tag, shape_index, data in slide_data.entries:
+        shape = shapes.get(shape_index)
+        if shape is None:
+            continue
+        if translations is not None:
+            data = _with_translations(tag, data, translations)
+        if tag == "table_element":
+            try:
+                apply_table_properties(shape.table, data)
+            except Exception as exc:  # pragma: no cover
+                print(f"Error applying table properties: {exc}")
+        else:
+            apply_shape_properties(shape, data)
+
+
+def write_translated_ppt(
+    presentation,
+    slides: List[SlideData],
+    translations: Dict[str, str],
+    output_ppt_path: str,
+) -> None:
+    """Apply translations from in-memory slide data to ``presentation`` and save it.
+
+    Unlike :func:`create_translated_ppt` no XML or JSON is parsed back.
+    """
+    try:
+        prs_slides = list(presentation.slides)
+        for slide_data in slides:
+            if 1 <= slide_data.number <= len(prs_slides):
+                apply_slide_data(prs_slides[slide_data.number - 1], slide_data, translations)
+        presentation.save(output_ppt_path)
+        print(f"Translated PowerPoint saved to: {output_ppt_path}")
+    except Exception as exc:  # pragma: no cover - logging only
+        print(f"Error creating translated PowerPoint: {exc}")
+
+
+def cleanup_intermediate_files(base_dir: Path, pattern: str = "*_slide_*.xml") -> None:
     """Remove intermediate XML files."""
     try:
         for file in base_dir.glob(pattern):
@@ -313,7 +593,6 @@ def process_ppt_file(
     translator: TranslationService,
     source_lang: str,
     target_lang: str,
-    max_workers: int = 4,
     cleanup: bool = True,
 ) -> Optional[Path]:
     """Process a single PowerPoint file from extraction to translated output."""
@@ -323,46 +602,37 @@ def process_ppt_file(
         raise ValueError(f"'{ppt_path}' is not a PowerPoint file.")
 
     base_dir = ppt_path.parent
+    intermediate_dir = None if cleanup else base_dir
 
-    print(f"Generating original XML for {ppt_path.name}...")
-    original_xml = ppt_to_xml(
-        str(ppt_path),
-        translator=None,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        max_workers=max_workers,
-    )
-    if original_xml:
-        original_output_path = base_dir / f"{ppt_path.stem}_original.xml"
-        with open(original_output_path, "w", encoding="utf-8") as handle:
-            handle.write(original_xml)
-        print(f"Original XML saved: {original_output_path}")
+    print(f"Reading {ppt_path.name}...")
+    presentation = Presentation(str(ppt_path))
+    slides = extract_deck(presentation)
+
+    original_output_path = base_dir / f"{ppt_path.stem}_original.xml"
+    write_xml(slides, original_output_path, file_name=ppt_path.name, intermediate_dir=intermediate_dir)
+    print(f"Original XML saved: {original_output_path}")
 
     print(
         f"Generating translated XML (from {source_lang} to {target_lang}) for {ppt_path.name}..."
     )
-    translated_xml = ppt_to_xml(
-        str(ppt_path),
-        translator=translator,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        max_workers=max_workers,
-    )
-    if not translated_xml:
-        return None
-
+    translations = translate_deck(slides, translator=translator, source_lang=source_lang, target_lang=target_lang)
     translated_output_path = base_dir / f"{ppt_path.stem}_translated.xml"
-    with open(translated_output_path, "w", encoding="utf-8") as handle:
-        handle.write(translated_xml)
+    write_xml(
+        slides,
+        translated_output_path,
+        file_name=ppt_path.name,
+        translations=translations,
+        intermediate_dir=intermediate_dir,
+    )
     print(f"Translated XML saved: {translated_output_path}")
 
     print(f"Creating translated PPT for {ppt_path.name}...")
     output_filename = f"{ppt_path.stem}_translated{ppt_path.suffix}"
     output_ppt_path = base_dir / output_filename
-    create_translated_ppt(str(ppt_path), str(translated_output_path), str(output_ppt_path))
+    write_translated_ppt(presentation, slides, translations, str(output_ppt_path))
 
     if cleanup:
-        cleanup_intermediate_files(base_dir)
+        cleanup_intermediate_files(base_dir, f"{glob.escape(ppt_path.stem)}_slide_*.xml")
         print("Cleanup complete.")
 
     return output_ppt_path
@@ -1,7 +1,8 @@
 """Provider factory for translation services."""
 from __future__ import annotations
 
-from typing import Dict, Type
+import functools
+from typing import Callable, Dict, Tuple, Type
 
 from .anthropic_provider import AnthropicProvider
 from .base import ProviderConfigurationError, TranslationProvider
@@ -29,19 +30,34 @@ def list_providers() -> list[str]:
     return sorted(PROVIDER_REGISTRY.keys())
 
 
-def create_provider(provider_name: str, *, model: str | None = None, **kwargs) -> TranslationProvider:
-    """Instantiate a provider by name."""
+@functools.lru_cache(maxsize=16)
+def _bind_provider(
+    provider_class: Type[TranslationProvider], frozen_options: Tuple[Tuple[str, str], ...]
+) -> Callable[..., TranslationProvider]:
+    """Return ``provider_class`` with ``frozen_options`` already bound."""
+    return functools.partial(provider_class, **dict(frozen_options))
+
+
+def _resolve_provider(provider_name: str, model: str | None) -> Callable[..., TranslationProvider]:
+    """Return the provider constructor with its default options already bound.
+
+    The registry and defaults are read on every call and only the binding is
+    cached, so later changes to either take effect immediately.
+    """
     name = provider_name.lower()
     if name not in PROVIDER_REGISTRY:
         raise ValueError(f"Unsupported provider '{provider_name}'. Available: {', '.join(list_providers())}")
-    provider_cls = PROVIDER_REGISTRY[name]
     default_options = PROVIDER_DEFAULTS.get(name, {}).copy()
     if model:
         default_options["model"] = model
     if "model" not in default_options:
         raise ValueError(f"No model specified for provider '{provider_name}'.")
-    default_options.update(kwargs)
-    return provider_cls(**default_options)
+    return _bind_provider(PROVIDER_REGISTRY[name], tuple(sorted(default_options.items())))
+
+
+def create_provider(provider_name: str, *, model: str | None = None, **kwargs) -> TranslationProvider:
+    """Instantiate a provider by name."""
+    return _resolve_provider(provider_name, model)(**kwargs)
 
 
 __all__ = [
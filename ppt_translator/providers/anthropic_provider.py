@@ -2,10 +2,21 @@
 from __future__ import annotations
 
 import os
+from typing import List, Sequence
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
-from .base import ProviderConfigurationError, TranslationProvider
+from ..rate_limit import RateLimiter
+from .base import (
+    DEFAULT_MAX_RETRIES,
+    ProviderConfigurationError,
+    TranslationProvider,
+    build_batch_system_prompt,
+    build_http_clients,
+    build_system_prompt,
+    translate_numbered_batch,
+    translate_numbered_batch_async,
+)
 
 
 class AnthropicProvider(TranslationProvider):
@@ -13,7 +24,15 @@ class AnthropicProvider(TranslationProvider):
 
     api_key_env = "ANTHROPIC_API_KEY"
 
-    def __init__(self, model: str, *, api_key: str | None = None, max_tokens: int = 4096, temperature: float = 0.3) -> None:
+    def __init__(
+        self,
+        model: str,
+        *,
+        api_key: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
         super().__init__(model, temperature=temperature)
         resolved_key = api_key or os.getenv(self.api_key_env)
         if not resolved_key:
@@ -21,19 +40,49 @@ class AnthropicProvider(TranslationProvider):
                 "Missing API key for provider 'Anthropic'. "
                 f"Set the {self.api_key_env} environment variable."
             )
-        self.client = Anthropic(api_key=resolved_key)
+        http_client, async_http_client = build_http_clients()
+        self.client = Anthropic(api_key=resolved_key, max_retries=max_retries, http_client=http_client)
+        self.async_client = AsyncAnthropic(
+            api_key=resolved_key, max_retries=max_retries, http_client=async_http_client
+        )
         self.max_tokens = max_tokens
+        self.rate_limiter = RateLimiter.from_env("ANTHROPIC")
 
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        system_prompt = (
-            "You are a translation assistant. Translate the user provided text "
-            f"from {source_lang} to {target_lang} while preserving tone and formatting."
-        )
+    def _complete(self, system_prompt: str, content: str) -> str:
+        self._throttle(system_prompt + content)
         response = self.client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
             system=system_prompt,
-            messages=[{"role": "user", "content": text}],
+            messages=[{"role": "user", "content": content}],
+        )
+        return " ".join(part.text.strip() for part in response.content if getattr(part, "text", "")).strip()
+
+    async def _complete_async(self, system_prompt: str, content: str) -> str:
+        await self._throttle_async(system_prompt + content)
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": content}],
         )
         return " ".join(part.text.strip() for part in response.content if getattr(part, "text", "")).strip()
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return self._complete(build_system_prompt(source_lang, target_lang), text)
+
+    def translate_batch(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        return translate_numbered_batch(
+            texts,
+            lambda numbered: self._complete(build_batch_system_prompt(source_lang, target_lang), numbered),
+            lambda text: self.translate(text, source_lang, target_lang),
+        )
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        return await translate_numbered_batch_async(
+            texts,
+            lambda numbered: self._complete_async(build_batch_system_prompt(source_lang, target_lang), numbered),
+            lambda text: self._complete_async(build_system_prompt(source_lang, target_lang), text),
+        )
@@ -1,34 +1,208 @@
 """Base classes for translation providers."""
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
+import json
 import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from ..rate_limit import RateLimiter, estimate_tokens
+
+
+_NUMBERED_SEGMENT_PATTERN = re.compile(r"^[ \t]*(\d+)\.[ \t]", re.MULTILINE)
+
+# Retries for 429, 5xx and connection errors, using the SDKs' exponential backoff with jitter.
+DEFAULT_MAX_RETRIES = 6
+
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 
 class ProviderConfigurationError(RuntimeError):
     """Raised when a provider cannot be configured properly."""
 
 
+def build_http_clients(*, max_connections: int = 100, max_keepalive_connections: int = 50):
+    """Return pooled ``(sync, async)`` httpx clients shared by a provider's SDK clients.
+
+    Connections are kept alive across requests and multiplexed over HTTP/2
+    when the optional ``h2`` package is installed.
+    """
+    import httpx  # installed with the openai/anthropic SDKs
+
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+    return httpx.Client(http2=http2, limits=limits), httpx.AsyncClient(http2=http2, limits=limits)
+
+
+@functools.lru_cache(maxsize=64)
+def build_system_prompt(source_lang: str, target_lang: str) -> str:
+    """Return the system prompt used for single-segment translation."""
+    return (
+        "You are a translation assistant. Translate the user provided text "
+        f"from {source_lang} to {target_lang} while preserving tone and formatting."
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def build_batch_system_prompt(source_lang: str, target_lang: str) -> str:
+    """Return the system prompt used for numbered multi-segment translation."""
+    return (
+        "You are a translation assistant. The user provides numbered segments "
+        f"such as '1. text'. Translate every segment from {source_lang} to {target_lang} "
+        "while preserving tone and formatting. Reply with the same numbered list, one "
+        "entry per segment, keeping the numbering and segment count unchanged and "
+        "adding no commentary."
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _system_message(build_prompt: Callable[[str, str], str], source_lang: str, target_lang: str) -> Dict[str, str]:
+    """Return the shared (read-only) system message for a language pair."""
+    return {"role": "system", "content": build_prompt(source_lang, target_lang)}
+
+
+def format_numbered_segments(texts: Sequence[str]) -> str:
+    """Join ``texts`` into a ``1. ...`` numbered list for a batched request."""
+    return "\n".join(f"{index}. {text}" for index, text in enumerate(texts, start=1))
+
+
+def parse_numbered_segments(response: str, expected: int) -> Optional[List[str]]:
+    """Split a numbered reply back into ``expected`` segments.
+
+    Only markers that continue the ``1, 2, 3...`` sequence are treated as
+    segment boundaries. ``None`` is returned when the count does not match so
+    callers can fall back to per-segment requests.
+    """
+    markers = []
+    for match in _NUMBERED_SEGMENT_PATTERN.finditer(response):
+        if int(match.group(1)) == len(markers) + 1:
+            markers.append(match)
+    if len(markers) != expected:
+        return None
+    segments: List[str] = []
+    for index, match in enumerate(markers):
+        end = markers[index + 1].start() if index + 1 < len(markers) else len(response)
+        segments.append(response[match.end() : end].strip())
+    return segments
+
+
+def _batchable_indices(texts: Sequence[str]) -> List[int]:
+    """Indices of texts that can be sent through the numbered protocol.
+
+    Texts that already contain numbered lines would be ambiguous, so they are
+    translated individually.
+    """
+    return [index for index, text in enumerate(texts) if not _NUMBERED_SEGMENT_PATTERN.search(text)]
+
+
+def _merge_numbered_reply(results: List[Optional[str]], batchable: List[int], reply: str) -> None:
+    segments = parse_numbered_segments(reply, len(batchable))
+    if segments is not None:
+        for index, segment in zip(batchable, segments):
+            results[index] = segment
+
+
+def translate_numbered_batch(
+    texts: Sequence[str],
+    request_batch: Callable[[str], str],
+    translate_one: Callable[[str], str],
+) -> List[str]:
+    """Translate ``texts`` with a single numbered request.
+
+    Ambiguous texts and any segments the batched reply failed to return are
+    translated individually through ``translate_one``.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    batchable = _batchable_indices(texts)
+    if len(batchable) > 1:
+        reply = request_batch(format_numbered_segments([texts[index] for index in batchable]))
+        _merge_numbered_reply(results, batchable, reply)
+    return [translate_one(text) if result is None else result for text, result in zip(texts, results)]
+
+
+async def translate_numbered_batch_async(
+    texts: Sequence[str],
+    request_batch: Callable[[str], Awaitable[str]],
+    translate_one: Callable[[str], Awaitable[str]],
+) -> List[str]:
+    """Asynchronous counterpart of :func:`translate_numbered_batch`."""
+    results: List[Optional[str]] = [None] * len(texts)
+    batchable = _batchable_indices(texts)
+    if len(batchable) > 1:
+        reply = await request_batch(format_numbered_segments([texts[index] for index in batchable]))
+        _merge_numbered_reply(results, batchable, reply)
+    missing = [index for index, result in enumerate(results) if result is None]
+    for index, translated in zip(missing, await asyncio.gather(*(translate_one(texts[i]) for i in missing))):
+        results[index] = translated
+    return results
+
+
 class TranslationProvider(ABC):
     """Abstract provider responsible for translating text."""
 
     def __init__(self, model: str, temperature: float = 0.3) -> None:
         self.model = model
         self.temperature = temperature
+        self.rate_limiter: RateLimiter | None = None
+
+    def _throttle(self, content: str) -> None:
+        """Wait for rate limiter capacity before sending ``content``."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(estimate_tokens(content))
+
+    async def _throttle_async(self, content: str) -> None:
+        """Asynchronous :meth:`_throttle`."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(estimate_tokens(content))
 
     @abstractmethod
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate ``text`` from ``source_lang`` to ``target_lang``."""
 
+    def translate_batch(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate several ``texts`` preserving order.
+
+        The default issues one request per text; providers able to pack
+        segments into a single request override this.
+        """
+        return [self.translate(text, source_lang, target_lang) for text in texts]
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        """Asynchronous :meth:`translate_batch`.
+
+        Providers without a native async client run the blocking call in a
+        worker thread so the event loop keeps other requests in flight.
+        """
+        return await asyncio.to_thread(self.translate_batch, texts, source_lang, target_lang)
+
+    def submit_batch_job(
+        self, batches: Sequence[Sequence[str]], source_lang: str, target_lang: str
+    ) -> Optional[List[List[Optional[str]]]]:
+        """Translate ``batches`` through the provider's offline batch API.
+
+        Returns ``None`` when the provider has no batch API or the job did not
+        complete, so callers use the regular concurrent requests instead.
+        Segments the job did not translate are ``None``.
+        """
+        return None
+
 
 class OpenAICompatibleProvider(TranslationProvider):
     """Provider implementation for OpenAI compatible chat completion APIs."""
 
     api_key_env: str = "OPENAI_API_KEY"
     default_base_url: str | None = None
+    supports_batch_jobs: bool = False
+    batch_poll_interval: float = 5.0
+    # Seconds to wait for an offline batch job before cancelling it; ``{PREFIX}_BATCH_TIMEOUT`` overrides.
+    batch_timeout: float = 4 * 60 * 60.0
 
     def __init__(
         self,
@@ -38,6 +212,7 @@ class OpenAICompatibleProvider(TranslationProvider):
         base_url: str | None = None,
         temperature: float = 0.3,
         organization: str | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ) -> None:
         super().__init__(model, temperature=temperature)
         resolved_key = api_key or os.getenv(self.api_key_env)
@@ -46,24 +221,145 @@ class OpenAICompatibleProvider(TranslationProvider):
                 f"Missing API key for provider '{self.__class__.__name__}'. "
                 f"Set the {self.api_key_env} environment variable."
             )
-        self.client = OpenAI(api_key=resolved_key, base_url=base_url or self.default_base_url, organization=organization)
+        http_client, async_http_client = build_http_clients()
+        self.client = OpenAI(
+            api_key=resolved_key,
+            base_url=base_url or self.default_base_url,
+            organization=organization,
+            max_retries=max_retries,
+            http_client=http_client,
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=resolved_key,
+            base_url=base_url or self.default_base_url,
+            organization=organization,
+            max_retries=max_retries,
+            http_client=async_http_client,
+        )
+        env_prefix = self.api_key_env.removesuffix("_API_KEY")
+        self.rate_limiter = RateLimiter.from_env(env_prefix)
+        batch_timeout = os.getenv(f"{env_prefix}_BATCH_TIMEOUT")
+        if batch_timeout:
+            self.batch_timeout = float(batch_timeout)
 
     def build_messages(self, text: str, source_lang: str, target_lang: str) -> List[Dict[str, str]]:
         """Construct chat messages sent to the model."""
-        system_prompt = (
-            "You are a translation assistant. Translate the user provided text "
-            f"from {source_lang} to {target_lang} while preserving tone and formatting."
-        )
+        return [_system_message(build_system_prompt, source_lang, target_lang), {"role": "user", "content": text}]
+
+    def build_batch_messages(self, numbered_text: str, source_lang: str, target_lang: str) -> List[Dict[str, str]]:
+        """Construct chat messages for a numbered multi-segment request."""
         return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text},
+            _system_message(build_batch_system_prompt, source_lang, target_lang),
+            {"role": "user", "content": numbered_text},
         ]
 
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+    def _complete(self, messages: List[Dict[str, str]]) -> str:
+        self._throttle("".join(message["content"] for message in messages))
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=self.build_messages(text, source_lang, target_lang),
+            messages=messages,
             temperature=self.temperature,
             stream=False,
         )
         return response.choices[0].message.content.strip()
+
+    async def _complete_async(self, messages: List[Dict[str, str]]) -> str:
+        await self._throttle_async("".join(message["content"] for message in messages))
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            stream=False,
+        )
+        return response.choices[0].message.content.strip()
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return self._complete(self.build_messages(text, source_lang, target_lang))
+
+    def translate_batch(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        return translate_numbered_batch(
+            texts,
+            lambda numbered: self._complete(self.build_batch_messages(numbered, source_lang, target_lang)),
+            lambda text: self.translate(text, source_lang, target_lang),
+        )
+
+    async def translate_batch_async(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        return await translate_numbered_batch_async(
+            texts,
+            lambda numbered: self._complete_async(self.build_batch_messages(numbered, source_lang, target_lang)),
+            lambda text: self._complete_async(self.build_messages(text, source_lang, target_lang)),
+        )
+
+    def submit_batch_job(
+        self, batches: Sequence[Sequence[str]], source_lang: str, target_lang: str
+    ) -> Optional[List[List[Optional[str]]]]:
+        """Send every batch as one request of a ``/v1/chat/completions`` batch job.
+
+        The job is polled with capped exponential backoff and cancelled once
+        ``batch_timeout`` seconds pass. ``None`` is returned when the job did
+        not complete; segments missing from a completed job's output (failed
+        requests, unparsable replies) are ``None`` in the result.
+        """
+        if not self.supports_batch_jobs:
+            return None
+        plans = [_batchable_indices(texts) for texts in batches]
+        lines = []
+        for index, (texts, batchable) in enumerate(zip(batches, plans)):
+            if not batchable:
+                continue
+            numbered = format_numbered_segments([texts[i] for i in batchable])
+            body = {
+                "model": self.model,
+                "messages": self.build_batch_messages(numbered, source_lang, target_lang),
+                "temperature": self.temperature,
+            }
+            lines.append(
+                json.dumps(
+                    {"custom_id": str(index), "method": "POST", "url": "/v1/chat/completions", "body": body},
+                    ensure_ascii=False,
+                )
+            )
+
+        if not lines:
+            return None
+        upload = self.client.files.create(
+            file=("translations.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        job = self.client.batches.create(
+            input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
+        delay = self.batch_poll_interval
+        deadline = time.monotonic() + self.batch_timeout
+        while job.status not in _BATCH_TERMINAL_STATUSES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"Batch job {job.id} did not finish within {self.batch_timeout:.0f}s; cancelling it.")
+                try:
+                    job = self.client.batches.cancel(job.id)
+                except Exception as exc:  # pragma: no cover - best effort cleanup
+                    print(f"Error cancelling batch job {job.id}: {exc}")
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 60.0)
+            job = self.client.batches.retrieve(job.id)
+        if job.status != "completed" or not job.output_file_id:
+            print(f"Batch job {job.id} ended with status '{job.status}'; using regular requests instead.")
+            return None
+
+        replies: Dict[str, str] = {}
+        for line in self.client.files.content(job.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            choices = ((record.get("response") or {}).get("body") or {}).get("choices") or []
+            if choices:
+                replies[record["custom_id"]] = choices[0]["message"]["content"].strip()
+
+        results: List[List[Optional[str]]] = []
+        for index, (texts, batchable) in enumerate(zip(batches, plans)):
+            merged: List[Optional[str]] = [None] * len(texts)
+            reply = replies.get(str(index))
+            if reply is not None:
+                _merge_numbered_reply(merged, batchable, reply)
+            results.append(merged)
+        return results
@@ -9,3 +9,4 @@ class OpenAIProvider(OpenAICompatibleProvider):
 
     api_key_env = "OPENAI_API_KEY"
     default_base_url = None
+    supports_batch_jobs = True
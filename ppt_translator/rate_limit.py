@@ -0,0 +1,90 @@
+"""Client-side request and token rate limiting for provider calls."""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+_WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (roughly four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class RateLimiter:
+    """Block callers until a request fits the per-minute request/token budget.
+
+    Usage is tracked over a sliding 60 second window so the pipeline runs at
+    the provider's sustained limit instead of tripping 429 responses and
+    falling into the client's exponential backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        *,
+        clock=time.monotonic,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_env(cls, prefix: str) -> Optional["RateLimiter"]:
+        """Build a limiter from ``{prefix}_RPM`` / ``{prefix}_TPM`` if either is set."""
+        rpm = os.getenv(f"{prefix}_RPM")
+        tpm = os.getenv(f"{prefix}_TPM")
+        if not rpm and not tpm:
+            return None
+        return cls(int(rpm) if rpm else None, int(tpm) if tpm else None)
+
+    def _prune(self, now: float) -> None:
+        while self._events and now - self._events[0][0] >= _WINDOW_SECONDS:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+
+    def _has_capacity(self, tokens: int) -> bool:
+        if not self._events:
+            return True
+        if self.requests_per_minute is not None and len(self._events) >= self.requests_per_minute:
+            return False
+        if self.tokens_per_minute is not None and self._tokens_in_window + tokens > self.tokens_per_minute:
+            return False
+        return True
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Record the request and return ``0`` or the seconds to wait (lock held)."""
+        now = self._clock()
+        self._prune(now)
+        if self._has_capacity(tokens):
+            self._events.append((now, tokens))
+            self._tokens_in_window += tokens
+            return 0.0
+        return self._events[0][0] + _WINDOW_SECONDS - now
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Wait until a request costing ``tokens`` may be sent, then record it."""
+        with self._condition:
+            while True:
+                delay = self._try_acquire(tokens)
+                if not delay:
+                    return
+                self._condition.wait(timeout=delay)
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """Asynchronous :meth:`acquire` that sleeps without blocking the event loop."""
+        while True:
+            with self._condition:
+                delay = self._try_acquire(tokens)
+            if not delay:
+                return
+            await asyncio.sleep(delay)
@@ -1,32 +1,124 @@
 """Translation service orchestrating providers, caching and chunking."""
 from __future__ import annotations
 
+import asyncio
 import re
 import threading
-from typing import Dict, List
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Dict, Iterator, List, Sequence, Tuple, TypeVar
 
+from .cache import PersistentCache, cache_key
 from .providers.base import TranslationProvider
 
-_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。！？])\s+")
+# Latin terminators need trailing whitespace (so "3.14" stays intact); CJK
+# full-width terminators end a sentence even when the next one follows directly.
+_CJK_TERMINATORS = "。！？"
+_SENTENCE_SPLIT_PATTERN = re.compile(rf"(?<=[.!?])\s+|(?<=[{_CJK_TERMINATORS}])\s*")
+
+_CJK_LANGUAGES = {"zh", "ja", "ko"}
+_HAS_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+_URL_OR_EMAIL_PATTERN = re.compile(r"^(?:[a-z][a-z0-9+.-]*://\S+|www\.\S+|[\w.+-]+@[\w-]+(?:\.[\w-]+)+)$", re.IGNORECASE)
+
+CacheKey = Tuple[str, str, str]
+T = TypeVar("T")
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield the stripped, non-empty sentences of ``text`` in a single scan."""
+    last = 0
+    for match in _SENTENCE_SPLIT_PATTERN.finditer(text):
+        sentence = text[last : match.start()].strip()
+        if sentence:
+            yield sentence
+        last = match.end()
+    tail = text[last:].strip()
+    if tail:
+        yield tail
+
+
+def _is_untranslatable(text: str, source_lang: str) -> bool:
+    """Return ``True`` for text that can be passed through without a provider call.
+
+    Numbers, dates, amounts, URLs, e-mail addresses and strings without any
+    letters (bullets, symbols) never need translating, and when the source
+    language is Chinese, Japanese or Korean a string without any CJK
+    characters (codes, English labels) has nothing to translate either.
+    """
+    stripped = text.strip()
+    if not any(char.isalpha() for char in stripped) or _URL_OR_EMAIL_PATTERN.match(stripped):
+        return True
+    language = source_lang.lower().split("-")[0].split("_")[0]
+    return language in _CJK_LANGUAGES and not _HAS_CJK_PATTERN.search(text)
 
 
 class TranslationService:
     """Translate text using a configured provider with caching support."""
 
-    def __init__(self, provider: TranslationProvider, *, max_chunk_size: int = 1000) -> None:
+    def __init__(
+        self,
+        provider: TranslationProvider,
+        *,
+        max_chunk_size: int = 1000,
+        max_cache_entries: int = 10_000,
+        max_concurrency: int = 50,
+        max_batch_items: int = 25,
+        batch_mode: str = "sync",
+        batch_job_min_texts: int = 100,
+        cache_path: str | Path | None = None,
+    ) -> None:
         self.provider = provider
         self.max_chunk_size = max_chunk_size
-        self._cache: Dict[str, str] = {}
+        self.max_batch_items = max_batch_items
+        self.max_cache_entries = max_cache_entries
+        self.max_concurrency = max_concurrency
+        self.batch_mode = batch_mode
+        # Smaller decks are cheaper to wait for with regular requests than an offline job.
+        self.batch_job_min_texts = batch_job_min_texts
+        self._cache: OrderedDict[CacheKey, str] = OrderedDict()
+        # Guards every access to the LRU cache: promotion on read reorders the
+        # OrderedDict and would otherwise race with eviction in ``_store``.
         self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._semaphore: asyncio.Semaphore | None = None
+        # Optional second level behind the in-memory cache that survives restarts.
+        self._disk_cache = PersistentCache(cache_path) if cache_path else None
+
+    def _disk_key(self, key: CacheKey) -> str:
+        text, source_lang, target_lang = key
+        return cache_key(type(self.provider).__name__, self.provider.model, source_lang, target_lang, text)
+
+    def _lookup(self, key: CacheKey) -> str | None:
+        """Return the cached value for ``key`` and mark it most recently used (lock held)."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _store(self, key: CacheKey, value: str) -> None:
+        """Insert ``key`` evicting the least recently used entry beyond the bound (lock held)."""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate ``text`` and cache repeated requests."""
-        if not text or text.isspace():
+        if not text or text.isspace() or _is_untranslatable(text, source_lang):
             return text
 
+        key = (text, source_lang, target_lang)
         with self._lock:
-            if text in self._cache:
-                return self._cache[text]
+            cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        if self._disk_cache is not None:
+            stored = self._disk_cache.get(self._disk_key(key))
+            if stored is not None:
+                with self._lock:
+                    self._store(key, stored)
+                return stored
 
         chunks = self.chunk_text(text, self.max_chunk_size)
         translated_chunks: List[str] = []
@@ -40,46 +132,173 @@ class TranslationService:
 
         combined = " ".join(part for part in translated_chunks if part)
         if not combined:
-            combined = text
+            with self._lock:
+                self._store(key, text)
+            return text
 
         with self._lock:
-            self._cache[text] = combined
+            self._store(key, combined)
+        if self._disk_cache is not None:
+            self._disk_cache.set_many([(self._disk_key(key), combined)])
         return combined
 
+    def translate_batch(self, texts: Sequence[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate ``texts`` using as few provider requests as possible.
+
+        Texts are deduplicated and checked against the in-memory cache, then
+        the on-disk cache if configured, in a single pass each; blank and
+        untranslatable entries are resolved locally. The remaining unique
+        texts are packed into batches of up to ``max_chunk_size`` characters
+        and ``max_batch_items`` segments, and texts longer than that go
+        through :meth:`translate` so they are chunked.
+        With ``batch_mode="async"`` and at least ``batch_job_min_texts``
+        pending texts, the batches are submitted as one offline provider batch
+        job when the provider supports it; segments the job does not return
+        are re-batched into regular requests.
+        """
+        unique = dict.fromkeys(
+            text for text in texts if text and not text.isspace() and not _is_untranslatable(text, source_lang)
+        )
+        lookup = self._lookup
+        with self._lock:
+            resolved = {
+                text: cached
+                for text in unique
+                if (cached := lookup((text, source_lang, target_lang))) is not None
+            }
+        if self._disk_cache is not None:
+            misses: Dict[str, CacheKey] = {}
+            for text in unique:
+                if text not in resolved:
+                    key = (text, source_lang, target_lang)
+                    misses[self._disk_key(key)] = key
+            stored = self._disk_cache.get_many(list(misses))
+            with self._lock:
+                for disk_key, value in stored.items():
+                    key = misses[disk_key]
+                    resolved[key[0]] = value
+                    self._store(key, value)
+
+        pending: List[str] = []
+        for text in unique:
+            if text in resolved:
+                continue
+            if len(text) > self.max_chunk_size:
+                resolved[text] = self.translate(text, source_lang, target_lang)
+            else:
+                pending.append(text)
+
+        batches = self._pack_batches(pending)
+        translated: Dict[str, str] = {}
+        if batches and self.batch_mode == "async" and len(pending) >= self.batch_job_min_texts:
+            job_replies = self.provider.submit_batch_job(batches, source_lang, target_lang)
+            if job_replies is not None:
+                for batch, replies in zip(batches, job_replies):
+                    translated.update(
+                        (original, result) for original, result in zip(batch, replies) if result is not None
+                    )
+                batches = self._pack_batches([text for text in pending if text not in translated])
+        if batches:
+            replies_by_batch = self._run(self._translate_batches(batches, source_lang, target_lang))
+            for batch, replies in zip(batches, replies_by_batch):
+                translated.update(zip(batch, replies))
+
+        persisted: List[Tuple[str, str]] = []
+        with self._lock:
+            for original, result in translated.items():
+                key = (original, source_lang, target_lang)
+                value = result.strip()
+                resolved[original] = value or original
+                self._store(key, resolved[original])
+                # Empty replies fall back to the source text for this run only.
+                if value and self._disk_cache is not None:
+                    persisted.append((self._disk_key(key), value))
+        if persisted:
+            self._disk_cache.set_many(persisted)
+
+        return [resolved.get(text, text) for text in texts]
+
+    async def _translate_batches(
+        self, batches: List[List[str]], source_lang: str, target_lang: str
+    ) -> List[List[str]]:
+        """Send all ``batches`` concurrently, at most ``max_concurrency`` at a time.
+
+        The semaphore is shared by every caller on the service loop, so decks
+        translated in parallel still respect one overall concurrency limit.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        semaphore = self._semaphore
+
+        async def run(batch: List[str]) -> List[str]:
+            async with semaphore:
+                return await self.provider.translate_batch_async(batch, source_lang, target_lang)
+
+        return await asyncio.gather(*(run(batch) for batch in batches))
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        """Run ``coroutine`` on the service event loop and wait for its result.
+
+        A single long-lived loop in a daemon thread keeps async HTTP clients
+        bound to one loop across calls, whichever thread the caller is on.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="translation-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _pack_batches(self, texts: List[str]) -> List[List[str]]:
+        """Group ``texts`` so each batch stays within the character and segment limits."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_len = 0
+        for text in texts:
+            if current and (
+                current_len + len(text) > self.max_chunk_size or len(current) >= self.max_batch_items
+            ):
+                batches.append(current)
+                current = []
+                current_len = 0
+            current.append(text)
+            current_len += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
     @staticmethod
     def chunk_text(text: str, max_chunk_size: int = 1000) -> List[str]:
         """Split long text into smaller chunks preserving sentence boundaries."""
         if len(text) <= max_chunk_size:
             return [text]
 
-        sentences = [segment.strip() for segment in _SENTENCE_SPLIT_PATTERN.split(text) if segment.strip()]
-        if not sentences:
-            sentences = [text]
-
         chunks: List[str] = []
         current: List[str] = []
         current_len = 0
 
-        for sentence in sentences:
+        for sentence in _iter_sentences(text):
             sentence_len = len(sentence)
-            if current and current_len + sentence_len + 1 > max_chunk_size:
-                chunks.append(" ".join(current))
+            # Full-width CJK sentences follow each other without a space.
+            separator = "" if not current or current[-1][-1] in _CJK_TERMINATORS else " "
+            if current and current_len + len(separator) + sentence_len > max_chunk_size:
+                chunks.append("".join(current))
                 current = []
                 current_len = 0
+                separator = ""
             if sentence_len > max_chunk_size:
                 if current:
-                    chunks.append(" ".join(current))
+                    chunks.append("".join(current))
                     current = []
                     current_len = 0
                 chunks.extend(
                     [sentence[i : i + max_chunk_size] for i in range(0, sentence_len, max_chunk_size)]
                 )
                 continue
-            current.append(sentence)
-            current_len += sentence_len + 1
+            current.append(separator + sentence)
+            current_len += len(separator) + sentence_len
 
         if current:
-            chunks.append(" ".join(current))
+            chunks.append("".join(current))
 
         if not chunks:
             return [text]
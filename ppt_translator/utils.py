@@ -1,34 +1,126 @@
 """Utility helpers for CLI and filesystem handling."""
 from __future__ import annotations
 
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, NamedTuple, Optional, Union
+
+_PPT_SUFFIXES = (".pptx", ".ppt")
+# Shortest name with a stem and a suffix, e.g. "a.ppt"; shorter names are rejected outright.
+_MIN_NAME_LENGTH = 5
+_QUOTE_CHARS = "'\""
+_SHELL_ESCAPE_PATTERN = re.compile(r"\\([ '])")
+
+
+def _is_presentation_name(name: str) -> bool:
+    """Case-insensitive suffix check that only lowercases the last five characters.
+
+    Like ``Path.suffix``, a leading dot is not a suffix, so hidden files such
+    as ``.pptx`` are rejected.
+    """
+    return (
+        len(name) >= _MIN_NAME_LENGTH
+        and name[-5:].lower().endswith(_PPT_SUFFIXES)
+        and name.rfind(".") > 0
+    )
 
 
 def clean_path(path: str) -> str:
     """Normalise shell provided paths, removing quotes and escaped spaces."""
-    normalised = path.strip("'\"")
-    normalised = normalised.replace("\\ ", " ")
-    normalised = normalised.replace("\\'", "'")
-    return normalised
+    return _SHELL_ESCAPE_PATTERN.sub(r"\1", path.strip(_QUOTE_CHARS))
 
 
-def iter_presentation_files(target: Path) -> Iterator[Path]:
-    """Yield PowerPoint files contained in *target*.
+class _WalkEntry(NamedTuple):
+    """A discovered presentation and the ``DirEntry`` it was found through."""
 
-    If *target* is a single file it will be yielded when it has the expected
-    suffix. When *target* is a directory the function walks the tree and yields
-    any ``.ppt`` or ``.pptx`` files that are discovered.
+    path: str
+    entry: Optional[os.DirEntry] = None
+
+    def stat(self) -> os.stat_result:
+        """Return the stat data of the file (following symlinks), cached on the ``DirEntry``."""
+        if self.entry is not None:
+            return self.entry.stat()
+        return os.stat(self.path)
+
+
+def _walk(root: str) -> Iterator[_WalkEntry]:
+    """Depth-first ``os.scandir`` walk of *root* yielding presentation files.
+
+    ``DirEntry`` type bits come from the directory listing itself, so no extra
+    stat call is made per entry.
     """
-    suffixes = {".ppt", ".pptx"}
-    if target.is_file():
-        if target.suffix.lower() in suffixes:
-            yield target
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif _is_presentation_name(entry.name) and entry.is_file():
+                        yield _WalkEntry(entry.path, entry)
+        except OSError:
+            continue
+
+
+def _parallel_walk(root: str, workers: int) -> Iterator[_WalkEntry]:
+    """Walk each top-level subdirectory of *root* in its own worker thread."""
+    subdirs: List[str] = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif _is_presentation_name(entry.name) and entry.is_file():
+                    yield _WalkEntry(entry.path, entry)
+    except OSError:
         return
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(list, _walk(subdir)) for subdir in subdirs]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
 
-    if not target.exists():
+def _iter_walk_entries(target: Union[str, os.PathLike], *, workers: int = 1) -> Iterator[_WalkEntry]:
+    """Yield a :class:`_WalkEntry` for every file :func:`iter_presentation_files` finds.
+
+    Sizes and modification times are then available through
+    :meth:`_WalkEntry.stat` without a second syscall per file.
+    """
+    root = os.fspath(target)
+    # One stat call decides between the missing, single-file and directory cases.
+    try:
+        mode = os.stat(root).st_mode
+    except OSError:
         return
+    if stat.S_ISREG(mode):
+        if _is_presentation_name(os.path.basename(root)):
+            yield _WalkEntry(root)
+        return
+    if not stat.S_ISDIR(mode):
+        return
+    if workers > 1:
+        yield from _parallel_walk(root, workers)
+    else:
+        yield from _walk(root)
+
 
-    for path in target.rglob("*"):
-        if path.is_file() and path.suffix.lower() in suffixes:
-            yield path
+def iter_presentation_files(target: Union[str, os.PathLike], *, workers: int = 1) -> Iterator[Path]:
+    """Yield PowerPoint files contained in *target*.
+
+    If *target* is a single file it will be yielded when it has the expected
+    suffix. When *target* is a directory the function walks the tree and yields
+    any ``.ppt`` or ``.pptx`` files that are discovered. Paths are handled as
+    plain strings internally and only wrapped in :class:`Path` when yielded.
+
+    With ``workers > 1`` the top-level subdirectories are scanned concurrently,
+    which helps on cold caches and network filesystems; results then arrive in
+    completion order rather than walk order.
+    """
+    for found in _iter_walk_entries(target, workers=workers):
+        yield Path(found.path)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from lxml import etree as ET
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.util import Inches, Pt
+
+from ppt_translator.pipeline import (
+    apply_shape_properties,
+    create_translated_ppt,
+    extract_deck,
+    extract_slide,
+    get_alignment_value,
+    get_shape_properties,
+    get_text_body_text,
+    get_vertical_anchor_value,
+    ppt_to_xml,
+    process_ppt_file,
+    render_xml,
+    write_xml,
+)
+from ppt_translator.providers.base import TranslationProvider
+from ppt_translator.translation import TranslationService
+
+
+class RecordingProvider(TranslationProvider):
+    def __init__(self) -> None:
+        super().__init__(model="dummy")
+        self.batches: list[list[str]] = []
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return text.upper()
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        self.batches.append(list(texts))
+        return [text.upper() for text in texts]
+
+
+def _build_deck(path):
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    for title in ("First slide", "Second slide"):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = title
+        slide.shapes.add_textbox(Inches(1), Inches(3), Inches(4), Inches(1)).text_frame.text = "Footer"
+        table = slide.shapes.add_table(1, 2, Inches(1), Inches(4), Inches(4), Inches(1)).table
+        table.cell(0, 0).text = "Footer"
+        table.cell(0, 1).text = "Cell"
+        table.cell(0, 1).vertical_anchor = MSO_ANCHOR.MIDDLE
+    prs.save(path)
+    return path
+
+
+def test_ppt_to_xml_translates_unique_strings_once(tmp_path):
+    deck = _build_deck(tmp_path / "deck.pptx")
+    provider = RecordingProvider()
+    translator = TranslationService(provider, max_chunk_size=1000)
+    root = ppt_to_xml(str(deck), translator=translator, source_lang="en", target_lang="fr")
+    assert root is not None
+    xml = ET.tostring(root, encoding="unicode")
+    assert "FIRST SLIDE" in xml and "CELL" in xml
+    sent = [text for batch in provider.batches for text in batch]
+    assert sorted(sent) == sorted(["First slide", "Second slide", "Footer", "Cell"])
+
+
+def test_process_ppt_file_writes_translated_deck(tmp_path):
+    deck = _build_deck(tmp_path / "deck.pptx")
+    translator = TranslationService(RecordingProvider(), max_chunk_size=1000)
+    output = process_ppt_file(deck, translator=translator, source_lang="en", target_lang="fr")
+    assert output is not None and output.exists()
+    texts = []
+    anchors = []
+    for slide in Presentation(str(output)).slides:
+        for shape in slide.shapes:
+            if shape.has_table:
+                texts.extend(cell.text for row in shape.table.rows for cell in row.cells)
+                anchors.append(shape.table.cell(0, 1).vertical_anchor)
+            elif shape.has_text_frame:
+                texts.append(shape.text_frame.text)
+    assert "FIRST SLIDE" in texts and "CELL" in texts
+    assert anchors == [MSO_ANCHOR.MIDDLE, MSO_ANCHOR.MIDDLE]
+    assert not list(tmp_path.glob("*slide_*.xml"))
+
+
+def test_process_ppt_file_keeps_intermediate_files_on_request(tmp_path):
+    deck = _build_deck(tmp_path / "deck.pptx")
+    translator = TranslationService(RecordingProvider(), max_chunk_size=1000)
+    process_ppt_file(deck, translator=translator, source_lang="en", target_lang="fr", cleanup=False)
+    assert sorted(path.name for path in tmp_path.glob("*slide_*.xml")) == [
+        "deck_slide_1_original.xml",
+        "deck_slide_1_translated.xml",
+        "deck_slide_2_original.xml",
+        "deck_slide_2_translated.xml",
+    ]
+
+
+def test_run_cli_keeps_intermediate_files_of_decks_sharing_a_directory(tmp_path, monkeypatch):
+    from ppt_translator import cli
+
+    _build_deck(tmp_path / "alpha.pptx")
+    _build_deck(tmp_path / "beta.pptx")
+    monkeypatch.setattr(cli, "create_provider", lambda name, model=None: RecordingProvider())
+
+    assert cli.run_cli([str(tmp_path), "--keep-intermediate", "--max-decks", "2"]) == 0
+    for stem in ("alpha", "beta"):
+        assert (tmp_path / f"{stem}_translated.pptx").exists()
+        for number in (1, 2):
+            for variant in ("original", "translated"):
+                slide = ET.parse(str(tmp_path / f"{stem}_slide_{number}_{variant}.xml")).getroot()
+                assert slide.get("number") == str(number)
+    assert len(list(tmp_path.glob("*_slide_*.xml"))) == 8
+
+
+def test_get_shape_properties_reads_first_run_font():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame
+    run = text_frame.paragraphs[0].add_run()
+    run.text = "Styled"
+    run.font.size = Pt(18)
+    run.font.bold = True
+    run.font.name = "Calibri"
+    run.font.color.rgb = RGBColor(0x12, 0xAB, 0xEF)
+    plain = text_frame.add_paragraph().add_run()
+    plain.text = "Plain"
+
+    data = get_shape_properties(slide.shapes[0])
+    assert data["text"] == "Styled\nPlain"
+    assert data["font_size"] == 18
+    assert data["bold"] is True and data["italic"] is None
+    assert data["font_name"] == "Calibri"
+    assert data["font_color"] == "12ABEF"
+
+    uncolored = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(4), Inches(1))
+    uncolored.text_frame.text = "No colour"
+    assert get_shape_properties(uncolored)["font_color"] is None
+    assert uncolored.text_frame._txBody.find(".//{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill") is None
+
+
+def test_enum_strings_round_trip_through_lookup_tables():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    shape.text_frame.text = "Centered"
+    shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+    stored = get_shape_properties(shape)["alignment"]
+    assert get_alignment_value(stored) == PP_ALIGN.CENTER
+    assert get_alignment_value("PP_ALIGN.CENTER (2)") == PP_ALIGN.CENTER
+    assert get_vertical_anchor_value("MIDDLE") == MSO_ANCHOR.MIDDLE
+    assert get_vertical_anchor_value("__import__('os')") is None
+
+
+def test_extract_slide_descends_into_groups_and_skips_empty_shapes():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(2), Inches(4), Inches(1)).text_frame.text = "Grouped"
+
+    slide_data = extract_slide(slide, 1)
+    assert [(tag, locator) for tag, locator, _ in slide_data.entries] == [("text_element", "1.0")]
+    assert list(slide_data.iter_texts()) == ["Grouped"]
+
+
+def test_apply_shape_properties_reuses_first_run():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    first = shape.text_frame.paragraphs[0].add_run()
+    first.text = "Link"
+    first.hyperlink.address = "https://example.com"
+    first._r.get_or_add_rPr().set("lang", "en-US")
+    shape.text_frame.paragraphs[0].add_run().text = " tail"
+    shape.text_frame.add_paragraph().text = "Second"
+
+    data = get_shape_properties(shape)
+    apply_shape_properties(shape, {**data, "text": "Lien"})
+    paragraphs = shape.text_frame.paragraphs
+    assert len(paragraphs) == 1 and len(paragraphs[0].runs) == 1
+    assert shape.text_frame.text == "Lien"
+    assert paragraphs[0].runs[0].hyperlink.address == "https://example.com"
+    assert paragraphs[0].runs[0]._r.rPr.get("lang") is None
+
+
+def test_get_text_body_text_matches_python_pptx():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame
+    text_frame.text = "Line one\vsoft break\nSecond paragraph"
+    paragraph = text_frame.add_paragraph()
+    paragraph.add_run().text = "Before"
+    paragraph.add_line_break()
+    paragraph.add_run().text = "after"
+    assert get_text_body_text(text_frame._txBody) == text_frame.text
+
+
+def test_write_xml_streams_the_rendered_document(tmp_path):
+    deck = _build_deck(tmp_path / "deck.pptx")
+    slides = extract_deck(Presentation(str(deck)))
+    translations = {"Footer": "Pied"}
+    output = tmp_path / "deck_translated.xml"
+    write_xml(slides, output, file_name="deck.pptx", translations=translations)
+    rendered = render_xml(slides, file_name="deck.pptx", translations=translations)
+    assert ET.tostring(ET.parse(str(output)).getroot()) == ET.tostring(rendered)
+
+
+def test_create_translated_ppt_applies_xml_by_tag_and_index(tmp_path):
+    deck = _build_deck(tmp_path / "deck.pptx")
+    translator = TranslationService(RecordingProvider(), max_chunk_size=1000)
+    root = ppt_to_xml(str(deck), translator=translator, source_lang="en", target_lang="fr", write_intermediate=False)
+    xml_path = tmp_path / "deck_translated.xml"
+    ET.ElementTree(root).write(str(xml_path), encoding="utf-8", xml_declaration=True)
+
+    output = tmp_path / "out.pptx"
+    create_translated_ppt(str(deck), str(xml_path), str(output))
+    shapes = list(Presentation(str(output)).slides[1].shapes)
+    assert shapes[0].text_frame.text == "SECOND SLIDE"
+    assert shapes[2].table.cell(0, 1).text == "CELL"
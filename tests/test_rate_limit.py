@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from ppt_translator.rate_limit import RateLimiter, estimate_tokens
+
+
+def test_from_env_requires_a_limit(monkeypatch):
+    monkeypatch.delenv("DUMMY_RPM", raising=False)
+    monkeypatch.delenv("DUMMY_TPM", raising=False)
+    assert RateLimiter.from_env("DUMMY") is None
+
+    monkeypatch.setenv("DUMMY_TPM", "1000")
+    limiter = RateLimiter.from_env("DUMMY")
+    assert limiter is not None
+    assert limiter.requests_per_minute is None
+    assert limiter.tokens_per_minute == 1000
+
+
+def test_acquire_releases_budget_after_window():
+    times = iter([0.0, 61.0])
+    limiter = RateLimiter(requests_per_minute=5, tokens_per_minute=10, clock=lambda: next(times))
+    limiter.acquire(8)
+    limiter.acquire(8)
+    assert limiter._has_capacity(2)
+    assert not limiter._has_capacity(3)
+
+
+def test_estimate_tokens_is_never_zero():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 40) == 10
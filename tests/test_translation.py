@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+
 from ppt_translator.translation import TranslationService
-from ppt_translator.providers.base import TranslationProvider
+from ppt_translator.providers.base import (
+    TranslationProvider,
+    format_numbered_segments,
+    parse_numbered_segments,
+    translate_numbered_batch,
+    translate_numbered_batch_async,
+)
 
 
 class DummyProvider(TranslationProvider):
@@ -14,6 +22,16 @@ class DummyProvider(TranslationProvider):
         return f"{text}->{target_lang}"
 
 
+class BatchingProvider(DummyProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        self.batches.append(list(texts))
+        return [f"{text}->{target_lang}" for text in texts]
+
+
 def test_chunk_text_respects_maximum_size():
     provider = DummyProvider()
     service = TranslationService(provider, max_chunk_size=20)
@@ -33,6 +51,17 @@ def test_translate_uses_cache():
     assert service.cache_size() == 1
 
 
+def test_chunk_text_splits_cjk_sentences_without_spaces():
+    text = "这是第一句。这是第二句！这是第三句？"
+    chunks = TranslationService.chunk_text(text, max_chunk_size=14)
+    assert chunks == ["这是第一句。这是第二句！", "这是第三句？"]
+
+
+def test_chunk_text_keeps_decimal_numbers_together():
+    chunks = TranslationService.chunk_text("Pi is 3.14 roughly. Next sentence here.", max_chunk_size=20)
+    assert chunks[0] == "Pi is 3.14 roughly."
+
+
 def test_chunk_text_handles_very_long_sentence():
     provider = DummyProvider()
     service = TranslationService(provider, max_chunk_size=50)
@@ -49,3 +78,282 @@ def test_clear_cache_resets_entries():
     assert service.cache_size() == 1
     service.clear_cache()
     assert service.cache_size() == 0
+
+
+def test_translate_batch_packs_unique_texts_into_one_request():
+    provider = BatchingProvider()
+    service = TranslationService(provider, max_chunk_size=100)
+    results = service.translate_batch(["Title", "", "Body", "Title"], "en", "fr")
+    assert results == ["Title->fr", "", "Body->fr", "Title->fr"]
+    assert provider.batches == [["Title", "Body"]]
+    assert service.translate("Body", "en", "fr") == "Body->fr"
+    assert provider.calls == []
+
+
+def test_translate_batch_splits_by_chunk_size():
+    provider = BatchingProvider()
+    service = TranslationService(provider, max_chunk_size=10)
+    service.translate_batch(["aaaa", "bbbb", "cccc", "d" * 15], "en", "fr")
+    assert sorted(provider.batches) == [["aaaa", "bbbb"], ["cccc"]]
+    assert provider.calls
+
+
+def test_translate_batch_caps_segments_per_request():
+    provider = BatchingProvider()
+    service = TranslationService(provider, max_chunk_size=1000, max_batch_items=2)
+    service.translate_batch(["a", "b", "c"], "en", "fr")
+    assert sorted(provider.batches) == [["a", "b"], ["c"]]
+
+
+def test_parse_numbered_segments_round_trip():
+    numbered = format_numbered_segments(["Hello", "Line one\nLine two"])
+    assert parse_numbered_segments(numbered, 2) == ["Hello", "Line one\nLine two"]
+    assert parse_numbered_segments("1. only one", 2) is None
+
+
+def test_translate_numbered_batch_falls_back_per_item():
+    single: list[str] = []
+    results = translate_numbered_batch(
+        ["a", "b", "1. listed"],
+        lambda numbered: "1. A",
+        lambda text: single.append(text) or text.upper(),
+    )
+    assert results == ["A", "B", "1. LISTED"]
+    assert single == ["a", "b", "1. listed"]
+
+
+def test_cache_is_keyed_by_language_pair_and_bounded():
+    provider = DummyProvider()
+    service = TranslationService(provider, max_chunk_size=100, max_cache_entries=2)
+    assert service.translate("Hello", "en", "fr") == "Hello->fr"
+    assert service.translate("Hello", "en", "de") == "Hello->de"
+    service.translate("World", "en", "fr")
+    assert service.cache_size() == 2
+    service.translate("Hello", "en", "fr")
+    assert provider.calls.count("Hello") == 3
+
+
+def test_cache_evicts_least_recently_used_entry():
+    provider = DummyProvider()
+    service = TranslationService(provider, max_chunk_size=100, max_cache_entries=2)
+    service.translate("A", "en", "fr")
+    service.translate("B", "en", "fr")
+    service.translate("A", "en", "fr")
+    service.translate("C", "en", "fr")
+    service.translate("A", "en", "fr")
+    assert provider.calls == ["A", "B", "C"]
+
+
+def test_translate_numbered_batch_async_matches_sync_protocol():
+    async def request_batch(numbered):
+        return "1. A\n2. B"
+
+    async def translate_one(text):
+        return text.upper()
+
+    results = asyncio.run(translate_numbered_batch_async(["a", "b", "1. c"], request_batch, translate_one))
+    assert results == ["A", "B", "1. C"]
+
+
+def test_untranslatable_texts_skip_the_provider():
+    provider = BatchingProvider()
+    service = TranslationService(provider, max_chunk_size=100)
+    texts = ["2024-01-31", "45.6%", "ACME Corp", "季度报告"]
+    assert service.translate_batch(texts, "zh", "en") == ["2024-01-31", "45.6%", "ACME Corp", "季度报告->en"]
+    assert provider.batches == [["季度报告"]]
+    assert service.translate("ACME Corp", "en", "fr") == "ACME Corp->fr"
+    for text in ("https://example.com/page", "www.example.com", "team@example.com", "• — ★", "①"):
+        assert service.translate(text, "en", "fr") == text
+    assert provider.calls == ["ACME Corp"]
+
+
+class BatchJobProvider(BatchingProvider):
+    def __init__(self, supported: bool, missing: tuple[str, ...] = ()) -> None:
+        super().__init__()
+        self.supported = supported
+        self.missing = missing
+        self.jobs: list[list[list[str]]] = []
+
+    def submit_batch_job(self, batches, source_lang, target_lang):
+        if not self.supported:
+            return None
+        self.jobs.append([list(batch) for batch in batches])
+        return [
+            [None if text in self.missing else f"{text}=>{target_lang}" for text in batch] for batch in batches
+        ]
+
+
+def test_async_batch_mode_submits_one_job_and_falls_back_when_unsupported():
+    provider = BatchJobProvider(supported=True)
+    service = TranslationService(
+        provider, max_chunk_size=100, max_batch_items=2, batch_mode="async", batch_job_min_texts=1
+    )
+    assert service.translate_batch(["a", "b", "c"], "en", "fr") == ["a=>fr", "b=>fr", "c=>fr"]
+    assert provider.jobs == [[["a", "b"], ["c"]]]
+    assert provider.batches == []
+
+    fallback = BatchJobProvider(supported=False)
+    service = TranslationService(fallback, max_chunk_size=100, batch_mode="async", batch_job_min_texts=1)
+    assert service.translate_batch(["a", "b"], "en", "fr") == ["a->fr", "b->fr"]
+    assert fallback.batches == [["a", "b"]]
+
+
+def test_async_batch_mode_skips_small_decks_and_rebatches_missing_segments():
+    small = BatchJobProvider(supported=True)
+    service = TranslationService(small, max_chunk_size=100, batch_mode="async", batch_job_min_texts=3)
+    assert service.translate_batch(["a", "b"], "en", "fr") == ["a->fr", "b->fr"]
+    assert small.jobs == [] and small.batches == [["a", "b"]]
+
+    partial = BatchJobProvider(supported=True, missing=("b", "d"))
+    service = TranslationService(partial, max_chunk_size=100, batch_mode="async", batch_job_min_texts=3)
+    assert service.translate_batch(["a", "b", "c", "d"], "en", "fr") == ["a=>fr", "b->fr", "c=>fr", "d->fr"]
+    assert partial.batches == [["b", "d"]]
+    assert partial.calls == []
+
+
+def test_openai_batch_job_maps_output_by_custom_id():
+    import json
+    from types import SimpleNamespace
+
+    from ppt_translator.providers.openai_provider import OpenAIProvider
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.uploaded = b""
+            self.files = SimpleNamespace(create=self._upload, content=self._content)
+            self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+        def _upload(self, *, file, purpose):
+            self.uploaded = file[1]
+            return SimpleNamespace(id="file-in")
+
+        def _create(self, **kwargs):
+            return SimpleNamespace(id="job", status="in_progress", output_file_id=None)
+
+        def _retrieve(self, job_id):
+            return SimpleNamespace(id=job_id, status="completed", output_file_id="file-out")
+
+        def _content(self, file_id):
+            lines = []
+            for line in self.uploaded.decode("utf-8").splitlines():
+                request = json.loads(line)
+                numbered = request["body"]["messages"][-1]["content"]
+                body = {"choices": [{"message": {"content": numbered.upper()}}]}
+                lines.append(json.dumps({"custom_id": request["custom_id"], "response": {"body": body}}))
+            return SimpleNamespace(text="\n".join(lines))
+
+    provider = object.__new__(OpenAIProvider)
+    TranslationProvider.__init__(provider, model="gpt-test")
+    provider.client = FakeClient()
+    provider.batch_poll_interval = 0
+    provider.translate = lambda text, source_lang, target_lang: f"single:{text}"
+
+    results = provider.submit_batch_job([["one", "two"], ["three"]], "en", "fr")
+    assert results == [["ONE", "TWO"], ["THREE"]]
+
+
+def _stuck_openai_provider(final_status: str | None):
+    """An OpenAI provider whose batch job ends with ``final_status`` or never finishes."""
+    from types import SimpleNamespace
+
+    from ppt_translator.providers.openai_provider import OpenAIProvider
+
+    class StuckClient:
+        def __init__(self) -> None:
+            self.cancelled: list[str] = []
+            self.files = SimpleNamespace(create=lambda **kwargs: SimpleNamespace(id="file-in"))
+            self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve, cancel=self._cancel)
+
+        def _create(self, **kwargs):
+            return SimpleNamespace(id="job", status="in_progress", output_file_id=None)
+
+        def _retrieve(self, job_id):
+            return SimpleNamespace(id=job_id, status=final_status or "in_progress", output_file_id=None)
+
+        def _cancel(self, job_id):
+            self.cancelled.append(job_id)
+            return SimpleNamespace(id=job_id, status="cancelling", output_file_id=None)
+
+    class RecordingOpenAIProvider(OpenAIProvider):
+        def translate(self, text, source_lang, target_lang):
+            self.calls.append(text)
+            return f"single:{text}"
+
+        async def translate_batch_async(self, texts, source_lang, target_lang):
+            self.batches.append(list(texts))
+            return [f"{text}->{target_lang}" for text in texts]
+
+    provider = object.__new__(RecordingOpenAIProvider)
+    TranslationProvider.__init__(provider, model="gpt-test")
+    provider.client = StuckClient()
+    provider.batch_poll_interval = 0
+    provider.batch_timeout = 0.01
+    provider.calls, provider.batches = [], []
+    return provider
+
+
+def test_failed_batch_job_falls_back_to_concurrent_batches():
+    provider = _stuck_openai_provider("failed")
+    service = TranslationService(provider, max_chunk_size=100, batch_mode="async", batch_job_min_texts=1)
+    assert service.translate_batch(["one", "two"], "en", "fr") == ["one->fr", "two->fr"]
+    assert provider.batches == [["one", "two"]]
+    assert provider.calls == []
+    assert provider.client.cancelled == []
+
+
+def test_submit_batch_job_cancels_after_timeout():
+    provider = _stuck_openai_provider(None)
+    assert provider.submit_batch_job([["one", "two"]], "en", "fr") is None
+    assert provider.client.cancelled == ["job"]
+    assert provider.calls == []
+
+
+def test_persistent_cache_survives_a_new_service(tmp_path):
+    cache_file = tmp_path / "cache" / "translations.sqlite"
+    first = BatchingProvider()
+    service = TranslationService(first, max_chunk_size=100, cache_path=cache_file)
+    assert service.translate_batch(["Hello", "World"], "en", "fr") == ["Hello->fr", "World->fr"]
+
+    second = BatchingProvider()
+    service = TranslationService(second, max_chunk_size=100, cache_path=cache_file)
+    assert service.translate_batch(["World", "Again"], "en", "fr") == ["World->fr", "Again->fr"]
+    assert service.translate("Hello", "en", "fr") == "Hello->fr"
+    assert second.batches == [["Again"]]
+    assert second.calls == []
+    assert service.translate_batch(["Hello"], "en", "de") == ["Hello->de"]
+
+
+def test_persistent_cache_skips_short_and_empty_batch_replies(tmp_path):
+    class ShortReplyProvider(BatchingProvider):
+        short = True
+
+        def translate_batch(self, texts, source_lang, target_lang):
+            replies = super().translate_batch(texts, source_lang, target_lang)
+            return ["", *replies[1:-1]] if self.short else replies
+
+    cache_file = tmp_path / "translations.sqlite"
+    first = ShortReplyProvider()
+    service = TranslationService(first, max_chunk_size=100, cache_path=cache_file)
+    assert service.translate_batch(["One", "Two", "Three"], "en", "fr") == ["One", "Two->fr", "Three"]
+
+    second = ShortReplyProvider()
+    second.short = False
+    service = TranslationService(second, max_chunk_size=100, cache_path=cache_file)
+    assert service.translate_batch(["One", "Two", "Three"], "en", "fr") == ["One->fr", "Two->fr", "Three->fr"]
+    assert second.batches == [["One", "Three"]]
+
+
+def test_create_provider_picks_up_registry_changes(monkeypatch):
+    from ppt_translator import providers
+
+    class EchoProvider(DummyProvider):
+        def __init__(self, model: str) -> None:
+            super().__init__()
+            self.model = model
+
+    monkeypatch.setitem(providers.PROVIDER_REGISTRY, "echo", EchoProvider)
+    monkeypatch.setitem(providers.PROVIDER_DEFAULTS, "echo", {"model": "first"})
+    assert providers.create_provider("echo").model == "first"
+    monkeypatch.setitem(providers.PROVIDER_DEFAULTS, "echo", {"model": "second"})
+    assert providers.create_provider("echo").model == "second"
+    assert providers.create_provider("echo", model="override").model == "override"
@@ -1,41 +1,105 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from ppt_translator.utils import clean_path, iter_presentation_files
+import pytest
+
+from ppt_translator.utils import _iter_walk_entries, clean_path, iter_presentation_files
+
+TREE_FILES = (
+    "deck.pptx",
+    "deck.ppt",
+    "notes.txt",
+    "nested/nested.pptx",
+    "nested/LEGACY.PPT",
+    "nested/notes.pptx.txt",
+    "nested/.ppt",
+    "nested/.pptx",
+)
+
+
+def _mkfiles(root: Path, *relative_paths: str) -> None:
+    """Create empty files (and their parent directories) below *root*."""
+    for relative in relative_paths:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+@pytest.fixture(scope="session")
+def ppt_tree_source(tmp_path_factory):
+    """Materialise the sample tree once per session."""
+    root = tmp_path_factory.mktemp("ppt_tree")
+    _mkfiles(root, *TREE_FILES)
+    return root
+
+
+@pytest.fixture
+def ppt_tree(tmp_path, ppt_tree_source):
+    """Give each test its own copy of the sample tree using hard links."""
+    for name in TREE_FILES:
+        target = tmp_path / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.link(ppt_tree_source / name, target)
+    return tmp_path
 
 
 def test_clean_path_strips_quotes_and_escapes():
     raw = "'~/My\\ Documents/presentation.pptx'"
     cleaned = clean_path(raw)
     assert cleaned == "~/My Documents/presentation.pptx"
+    assert clean_path("/decks/Bob\\'s\\ deck.pptx") == "/decks/Bob's deck.pptx"
 
 
-def test_iter_presentation_files_returns_expected(tmp_path):
-    pptx_file = tmp_path / "deck.pptx"
-    ppt_file = tmp_path / "deck.ppt"
-    txt_file = tmp_path / "notes.txt"
-    nested_dir = tmp_path / "nested"
-    nested_dir.mkdir()
-    nested_pptx = nested_dir / "nested.pptx"
-
-    pptx_file.touch()
-    ppt_file.touch()
-    txt_file.touch()
-    nested_pptx.touch()
+def test_iter_presentation_files_returns_expected(ppt_tree):
+    expected = ["deck.pptx", "deck.ppt", "nested/nested.pptx", "nested/LEGACY.PPT"]
+    assert set(iter_presentation_files(ppt_tree)) == {ppt_tree / name for name in expected}
 
-    results = sorted(iter_presentation_files(tmp_path))
-    assert results == sorted([pptx_file, ppt_file, nested_pptx])
 
-
-def test_iter_presentation_files_handles_file_input(tmp_path):
-    pptx_file = tmp_path / "deck.pptx"
-    pptx_file.touch()
+def test_iter_presentation_files_handles_file_input(ppt_tree):
+    pptx_file = ppt_tree / "deck.pptx"
     results = list(iter_presentation_files(pptx_file))
     assert results == [pptx_file]
+    assert list(iter_presentation_files(str(pptx_file))) == [pptx_file]
 
 
 def test_iter_presentation_files_missing_path(tmp_path):
     missing = tmp_path / "missing"
     results = list(iter_presentation_files(missing))
     assert results == []
+
+
+def test_iter_presentation_files_skips_symlinks_that_are_not_files(ppt_tree):
+    (ppt_tree / "broken.pptx").symlink_to(ppt_tree / "missing.pptx")
+    (ppt_tree / "folder.pptx").symlink_to(ppt_tree / "nested", target_is_directory=True)
+    (ppt_tree / "nested" / "linked.pptx").symlink_to(ppt_tree / "deck.pptx")
+
+    expected = ["deck.pptx", "deck.ppt", "nested/nested.pptx", "nested/LEGACY.PPT", "nested/linked.pptx"]
+    assert set(iter_presentation_files(ppt_tree)) == {ppt_tree / name for name in expected}
+    assert set(iter_presentation_files(ppt_tree, workers=2)) == {ppt_tree / name for name in expected}
+
+
+def test_iter_presentation_files_parallel_matches_serial(tmp_path):
+    _mkfiles(
+        tmp_path,
+        "top.pptx",
+        *(f"{name}/{name}.pptx" for name in "abc"),
+        *(f"{name}/deep/{name}.ppt" for name in "abc"),
+    )
+
+    serial = set(iter_presentation_files(tmp_path))
+    assert len(serial) == 7
+    assert set(iter_presentation_files(tmp_path, workers=4)) == serial
+
+
+def test_walk_entries_expose_cached_stat(ppt_tree):
+    linked = ppt_tree / "nested" / "linked.pptx"
+    linked.symlink_to(ppt_tree / "deck.pptx")
+    entries = {Path(found.path): found for found in _iter_walk_entries(ppt_tree)}
+    assert set(entries) == set(iter_presentation_files(ppt_tree))
+    deck = ppt_tree / "deck.pptx"
+    assert entries[deck].stat().st_ino == os.stat(deck).st_ino
+    (single,) = _iter_walk_entries(linked)
+    assert single.entry is None
+    assert single.stat().st_ino == entries[linked].stat().st_ino == os.stat(deck).st_ino